@@ -2,16 +2,19 @@
 AI Image Generator - Automatic Prompt Enhancer
 A production-ready Streamlit application for image generation with automatic prompt enhancement.
 
-Uses Hugging Face InferenceClient with stabilityai/stable-diffusion-xl-base-1.0 model.
+Uses Hugging Face InferenceClient with Stable Diffusion XL (base and Turbo) models.
 Features automatic prompt enhancement with style, camera angle, and detail level control.
 """
 
+import random
+import requests
 import streamlit as st
 from huggingface_hub import InferenceClient
 from PIL import Image
 from io import BytesIO
-import base64
-from typing import Optional, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 # =============================================================================
 # CONFIGURATION & CONSTANTS
@@ -32,6 +35,35 @@ APP_VERSION = "4.0.0"
 # Model configuration
 MODEL_NAME = "stabilityai/stable-diffusion-xl-base-1.0"
 
+# Maximum images per generation request
+MAX_IMAGES_PER_REQUEST = 4
+
+# Largest base seed; image i of a request uses seed + i
+MAX_SEED = 2 ** 31 - 1
+
+# Generation defaults
+DEFAULT_INFERENCE_STEPS = 25
+DEFAULT_GUIDANCE_SCALE = 7.0
+
+# Model presets: label -> (model id, default steps, default guidance scale)
+# Distilled models need only a few steps; SDXL-Turbo requires guidance_scale=0.0
+MODEL_PRESETS = {
+    "SDXL (quality)": (MODEL_NAME, DEFAULT_INFERENCE_STEPS, DEFAULT_GUIDANCE_SCALE),
+    "SDXL-Turbo (fast)": ("stabilityai/sdxl-turbo", 4, 0.0)
+}
+
+# Display width of image previews in pixels
+PREVIEW_SIZE = 500
+
+# Per-attempt request timeout in seconds; without one the client waits on a
+# loading model (503) indefinitely
+REQUEST_TIMEOUT = 60
+
+# Retry configuration for transient API errors (rate limits, timeouts)
+MAX_RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 2.0
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
 # Style options
 STYLE_OPTIONS = [
     "Realistic",
@@ -58,32 +90,78 @@ DETAIL_LEVEL_OPTIONS = [
     "Ultra"
 ]
 
+# Base quality descriptors
+BASE_QUALITY = "ultra detailed, high quality, cinematic lighting, realistic shadows"
+
+# Style mapping
+STYLE_MAP = {
+    "Realistic": "photorealistic, real world textures",
+    "3D Render": "3D render, unreal engine style",
+    "Anime": "anime style, vibrant colors",
+    "Cyberpunk": "cyberpunk theme, neon lighting",
+    "Cinematic": "dramatic lighting, movie scene composition"
+}
+
+# Detail level mapping
+DETAIL_MAP = {
+    "Low": "",
+    "Medium": "detailed background",
+    "High": "extremely detailed environment, volumetric lighting",
+    "Ultra": "hyper detailed environment, global illumination, 8k resolution"
+}
+
+# Enhanced prompt template: camera angle, style, prompt, detail, base quality
+PROMPT_TEMPLATE = "{}, {}, {}, {}, {}".format
+
+# Custom CSS (colors are set by the theme in .streamlit/config.toml)
+CUSTOM_CSS = """
+    <style>
+    h1, h2, h3 { color: #ff4b4b; font-family: 'Helvetica Neue', sans-serif; }
+    .stButton > button, .stFormSubmitButton > button { background-color: #ff4b4b; color: white; border: none; border-radius: 5px; padding: 10px 20px; font-weight: bold; }
+    .stButton > button:hover, .stFormSubmitButton > button:hover { background-color: #ff6b6b; }
+    .stButton > button:disabled, .stFormSubmitButton > button:disabled { background-color: #555; color: #888; }
+    .stMetric { background-color: #1e1e1e; padding: 10px; border-radius: 5px; }
+    hr { border-color: #333; }
+    </style>
+"""
+
 # =============================================================================
 # SESSION STATE INITIALIZATION
 # =============================================================================
 
 def initialize_session_state():
     """Initialize session state variables."""
-    if 'generated_image' not in st.session_state:
-        st.session_state.generated_image = None
+    if 'generated_images' not in st.session_state:
+        st.session_state.generated_images = []
     if 'image_count' not in st.session_state:
         st.session_state.image_count = 0
     if 'error_message' not in st.session_state:
         st.session_state.error_message = None
     if 'final_prompt' not in st.session_state:
         st.session_state.final_prompt = None
+    if 'seed' not in st.session_state:
+        st.session_state.seed = random.randint(0, MAX_SEED)
 
 
 # =============================================================================
 # CONFIGURATION FUNCTIONS
 # =============================================================================
 
+@st.cache_resource(show_spinner=False)
+def _read_hf_token() -> str:
+    """
+    Read the Hugging Face API token from secrets once per process.
+    
+    Raises if the token is missing, so only successful lookups are cached
+    and a token added to secrets.toml later is picked up.
+    """
+    return st.secrets['HF_TOKEN']
+
+
 def get_hf_token() -> Optional[str]:
     """Get Hugging Face API token from secrets."""
     try:
-        if hasattr(st, 'secrets') and 'HF_TOKEN' in st.secrets:
-            return st.secrets['HF_TOKEN']
-        return None
+        return _read_hf_token()
     except Exception:
         return None
 
@@ -105,28 +183,8 @@ def enhance_prompt(user_prompt: str, style: str, camera_angle: str, detail_level
     Returns:
         Enhanced prompt string
     """
-    # Base quality descriptors
-    base_quality = "ultra detailed, high quality, cinematic lighting, realistic shadows"
-    
-    # Style mapping
-    style_map = {
-        "Realistic": "photorealistic, real world textures",
-        "3D Render": "3D render, unreal engine style",
-        "Anime": "anime style, vibrant colors",
-        "Cyberpunk": "cyberpunk theme, neon lighting",
-        "Cinematic": "dramatic lighting, movie scene composition"
-    }
-    
-    # Detail level mapping
-    detail_map = {
-        "Low": "",
-        "Medium": "detailed background",
-        "High": "extremely detailed environment, volumetric lighting",
-        "Ultra": "hyper detailed environment, global illumination, 8k resolution"
-    }
-    
     # Build final prompt
-    final_prompt = f"{camera_angle}, {style_map.get(style)}, {user_prompt}, {detail_map.get(detail_level)}, {base_quality}"
+    final_prompt = PROMPT_TEMPLATE(camera_angle, STYLE_MAP[style], user_prompt, DETAIL_MAP[detail_level], BASE_QUALITY)
     
     return final_prompt
 
@@ -135,49 +193,147 @@ def enhance_prompt(user_prompt: str, style: str, camera_angle: str, detail_level
 # IMAGE GENERATION FUNCTIONS
 # =============================================================================
 
-def generate_image(prompt: str, negative_prompt: str) -> Tuple[Optional[Image.Image], str]:
+@st.cache_resource
+def get_client(token: str) -> InferenceClient:
     """
-    Generate image using Hugging Face InferenceClient.
+    Get a shared InferenceClient for the given token.
+    
+    The client object is cached across reruns and sessions. It holds no
+    connection pool itself; huggingface_hub keeps HTTP sessions per thread,
+    which the shared worker pool from get_executor keeps alive. The token is
+    part of the cache key, so rotating it creates a fresh client.
+    """
+    return InferenceClient(token=token, timeout=REQUEST_TIMEOUT)
+
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared worker pool for text-to-image requests.
+    
+    The threads persist across clicks and sessions, so the per-thread HTTP
+    sessions kept by huggingface_hub are reused. The pool size also caps
+    concurrent requests across all users.
+    """
+    return ThreadPoolExecutor(max_workers=MAX_IMAGES_PER_REQUEST, thread_name_prefix="text_to_image")
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether an API error is worth retrying."""
+    if isinstance(error, (TimeoutError, requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in RETRYABLE_STATUS_CODES
+
+
+@st.cache_data(ttl=24 * 60 * 60, max_entries=32, show_spinner=False)
+def _text_to_image_bytes(
+    prompt: str,
+    negative_prompt: str,
+    width: int,
+    height: int,
+    guidance_scale: float,
+    num_inference_steps: int,
+    seed: int,
+    model: str,
+    _client: InferenceClient
+) -> bytes:
+    """
+    Call the text-to-image endpoint and return the result as PNG bytes.
+    
+    The client only exposes the decoded image, so it is encoded once here.
+    These full-resolution bytes are the default download; previews and
+    palette downloads are derived from them.
+    
+    Results are cached on the generation parameters so identical requests
+    skip the remote call. The client is excluded from hashing. Transient
+    errors are retried with exponential backoff. Concurrent identical calls,
+    e.g. from other sessions, wait on st.cache_data's per-key lock and share
+    a single upstream request.
+    """
+    for attempt in range(MAX_RETRY_ATTEMPTS):
+        try:
+            image = _client.text_to_image(
+                prompt,
+                model=model,
+                width=width,
+                height=height,
+                guidance_scale=guidance_scale,
+                num_inference_steps=num_inference_steps,
+                negative_prompt=negative_prompt,
+                seed=seed
+            )
+            break
+        except Exception as e:
+            if attempt == MAX_RETRY_ATTEMPTS - 1 or not _is_transient_error(e):
+                raise
+            time.sleep(RETRY_BASE_DELAY * 2 ** attempt)
+    
+    # Convert to RGB if necessary
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    
+    # Fast zlib level: deflate dominates encode time and size matters little here
+    buffer = BytesIO()
+    image.save(buffer, format='PNG', compress_level=1, optimize=False)
+    return buffer.getvalue()
+
+
+def generate_image(
+    prompt: str,
+    negative_prompt: str,
+    num_images: int = 1,
+    num_inference_steps: int = DEFAULT_INFERENCE_STEPS,
+    guidance_scale: float = DEFAULT_GUIDANCE_SCALE,
+    model: str = MODEL_NAME,
+    seed: int = 0
+) -> Tuple[List[bytes], str]:
+    """
+    Generate images using Hugging Face InferenceClient.
+    
+    Multiple images are requested concurrently, each with its own seed.
     
     Args:
         prompt: Enhanced text prompt for image generation
         negative_prompt: Negative prompt to avoid certain features
+        num_images: Number of images to generate
+        num_inference_steps: Number of diffusion steps
+        guidance_scale: How closely to follow the prompt
+        model: Hugging Face model id
+        seed: Seed for the first image; image i uses seed + i
         
     Returns:
-        Tuple of (PIL Image or None, error_message)
+        Tuple of (list of PNG image bytes, error_message)
     """
     # Get API token
     HF_TOKEN = get_hf_token()
     if not HF_TOKEN:
-        return None, "Hugging Face API token not configured. Please add HF_TOKEN to .streamlit/secrets.toml"
+        return [], "Hugging Face API token not configured. Please add HF_TOKEN to .streamlit/secrets.toml"
     
     try:
-        # Initialize client
-        client = InferenceClient(token=HF_TOKEN)
+        # Get cached client
+        client = get_client(HF_TOKEN)
         
-        # Generate image with fixed parameters
-        image = client.text_to_image(
-            prompt,
-            model=MODEL_NAME,
-            width=768,
-            height=768,
-            guidance_scale=8.5,
-            num_inference_steps=30,
-            negative_prompt=negative_prompt
-        )
-        
-        # Convert to PIL Image if needed
-        if not isinstance(image, Image.Image):
-            image = Image.fromarray(image)
+        def _generate(seed: int) -> bytes:
+            return _text_to_image_bytes(
+                prompt,
+                negative_prompt,
+                width=768,
+                height=768,
+                guidance_scale=guidance_scale,
+                num_inference_steps=num_inference_steps,
+                seed=seed,
+                model=model,
+                _client=client
+            )
         
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        # Fire one request per image concurrently
+        images = list(get_executor().map(_generate, range(seed, seed + num_images)))
         
-        return image, ""
+        return images, ""
         
     except Exception as e:
-        return None, f"Image generation failed: {str(e)}"
+        return [], f"Image generation failed: {str(e)}"
 
 
 # =============================================================================
@@ -200,16 +356,87 @@ def render_sidebar():
     
     st.sidebar.markdown("---")
     
-    # Model info
+    # Model selection
     st.sidebar.header("📦 Model")
-    st.sidebar.info(f"Using: **{MODEL_NAME}**")
+    model_label = st.sidebar.selectbox(
+        "Model",
+        options=list(MODEL_PRESETS),
+        help="Distilled models trade some quality for much faster generation"
+    )
+    model, preset_steps, preset_guidance = MODEL_PRESETS[model_label]
+    st.sidebar.info(f"Using: **{model}**")
+    
+    st.sidebar.markdown("---")
+    
+    # Generation settings
+    st.sidebar.header("⚙️ Generation")
+    num_inference_steps = st.sidebar.slider(
+        "Quality vs Speed (steps)",
+        min_value=1,
+        max_value=40,
+        value=preset_steps,
+        help="Generation time grows roughly linearly with steps. Defaults to the selected model's recommended count"
+    )
+    guidance_scale = st.sidebar.slider(
+        "Guidance scale",
+        min_value=0.0,
+        max_value=15.0,
+        value=preset_guidance,
+        step=0.5,
+        disabled=preset_guidance == 0.0,
+        help="Higher values follow the prompt more closely. Around 7 works well at lower step counts"
+    )
+    
+    st.sidebar.markdown("---")
+    
+    # Output settings
+    st.sidebar.header("🖼️ Output")
+    num_images = st.sidebar.slider(
+        "Number of images",
+        min_value=1,
+        max_value=MAX_IMAGES_PER_REQUEST,
+        value=1,
+        help="Images are generated concurrently"
+    )
+    palette_download = st.sidebar.checkbox(
+        "Fast download (8-bit palette)",
+        value=False,
+        help="Download a 256-color PNG, typically 3-5x smaller with minor color loss"
+    )
+    st.sidebar.checkbox(
+        "New variation each click",
+        value=True,
+        key="new_variation",
+        help="Pick a new seed on every Generate. Turn off to reuse the seed below"
+    )
+    seed = st.sidebar.number_input(
+        "Seed",
+        min_value=0,
+        max_value=MAX_SEED,
+        step=1,
+        key="seed",
+        help="Identical settings and seed return the cached image"
+    )
     
     st.sidebar.markdown("---")
     
     # Statistics
     st.sidebar.header("📊 Statistics")
     
-    return {}
+    return {
+        "model": model,
+        "num_inference_steps": num_inference_steps,
+        "guidance_scale": guidance_scale,
+        "num_images": num_images,
+        "palette_download": palette_download,
+        "seed": seed
+    }
+
+
+def _roll_seed():
+    """Pick a new seed before the rerun when new variations are enabled."""
+    if st.session_state.get("new_variation", True):
+        st.session_state.seed = random.randint(0, MAX_SEED)
 
 
 def render_main_content(settings: dict):
@@ -236,74 +463,88 @@ HF_TOKEN = "your_huggingface_token_here"
             """, language="toml")
         return
     
-    # Main prompt input
-    st.header("📝 Main Prompt")
-    user_prompt = st.text_area(
-        "Enter a simple prompt:",
-        placeholder="A cat sitting on a couch",
-        height=60,
-        help="Enter your basic prompt - it will be automatically enhanced"
-    )
-    
-    # Enhancement controls
-    st.header("⚙️ Enhancement Controls")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Style dropdown
-        style = st.selectbox(
-            "🎭 Style",
-            options=STYLE_OPTIONS,
-            help="Select the visual style"
+    # Input widgets are grouped in a form so edits don't rerun the script
+    # until the user submits
+    with st.form("gen_form", clear_on_submit=False):
+        # Main prompt input
+        st.header("📝 Main Prompt")
+        user_prompt = st.text_area(
+            "Enter a simple prompt:",
+            placeholder="A cat sitting on a couch",
+            height=60,
+            help="Enter your basic prompt - it will be automatically enhanced"
         )
         
-        # Camera angle dropdown
-        camera_angle = st.selectbox(
-            "📷 Camera Angle",
-            options=CAMERA_ANGLE_OPTIONS,
-            help="Select the camera angle"
-        )
+        # Enhancement controls
+        st.header("⚙️ Enhancement Controls")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Style dropdown
+            style = st.selectbox(
+                "🎭 Style",
+                options=STYLE_OPTIONS,
+                help="Select the visual style"
+            )
+            
+            # Camera angle dropdown
+            camera_angle = st.selectbox(
+                "📷 Camera Angle",
+                options=CAMERA_ANGLE_OPTIONS,
+                help="Select the camera angle"
+            )
+        
+        with col2:
+            # Detail level dropdown
+            detail_level = st.selectbox(
+                "✨ Detail Level",
+                options=DETAIL_LEVEL_OPTIONS,
+                index=2,
+                help="Select the level of detail"
+            )
+            
+            # Show info about current settings
+            st.info(
+                f"📐 Image Size: 768x768 | Guidance: {settings['guidance_scale']} | "
+                f"Steps: {settings['num_inference_steps']}"
+            )
+        
+        # Submit buttons
+        st.markdown("---")
+        col1, col2 = st.columns([1, 4])
+        
+        with col1:
+            generate_button = st.form_submit_button(
+                "🚀 Generate Image",
+                type="primary",
+                use_container_width=True,
+                on_click=_roll_seed
+            )
+        
+        with col2:
+            st.form_submit_button("🔍 Preview Prompt", use_container_width=True)
+    
+    # Clear button (forms only allow submit buttons, so it sits just below)
+    col1, col2 = st.columns([1, 4])
     
     with col2:
-        # Detail level dropdown
-        detail_level = st.selectbox(
-            "✨ Detail Level",
-            options=DETAIL_LEVEL_OPTIONS,
-            index=2,
-            help="Select the level of detail"
-        )
-        
-        # Show info about current settings
-        st.info("📐 Image Size: 768x768 | Guidance: 8.5 | Steps: 30")
+        clear_button = st.button("🗑️ Clear", use_container_width=True)
     
     # Preview enhanced prompt
     if user_prompt:
         enhanced_prompt = enhance_prompt(user_prompt, style, camera_angle, detail_level)
         with st.expander("🔍 Preview Enhanced Prompt"):
             st.code(enhanced_prompt, language="text")
+    elif generate_button:
+        st.warning("Please enter a prompt first.")
     
     # Negative prompt (automatically set)
     negative_prompt = "blurry, low quality, cropped, distorted, extra limbs"
     
-    # Generate button
-    st.markdown("---")
-    col1, col2 = st.columns([1, 4])
-    
-    with col1:
-        generate_button = st.button(
-            "🚀 Generate Image",
-            type="primary",
-            disabled=not user_prompt,
-            use_container_width=True
-        )
-    
-    with col2:
-        clear_button = st.button("🗑️ Clear", use_container_width=True)
-    
     # Handle clear
     if clear_button:
-        st.session_state.generated_image = None
+        st.session_state.generated_images = []
         st.session_state.error_message = None
         st.session_state.final_prompt = None
         st.rerun()
@@ -313,58 +554,79 @@ HF_TOKEN = "your_huggingface_token_here"
         # Enhance the prompt
         final_prompt = enhance_prompt(user_prompt, style, camera_angle, detail_level)
         
-        # Generate image with loading spinner
+        # Generate images with loading spinner
         with st.spinner("🎨 Generating image... This may take up to 3 minutes."):
-            image, error = generate_image(
+            images, error = generate_image(
                 prompt=final_prompt,
-                negative_prompt=negative_prompt
+                negative_prompt=negative_prompt,
+                num_images=settings.get("num_images", 1),
+                num_inference_steps=settings.get("num_inference_steps", DEFAULT_INFERENCE_STEPS),
+                guidance_scale=settings.get("guidance_scale", DEFAULT_GUIDANCE_SCALE),
+                model=settings.get("model", MODEL_NAME),
+                seed=settings.get("seed", 0)
             )
         
         if error:
             st.session_state.error_message = error
             st.session_state.final_prompt = None
             st.error(f"❌ {error}")
-        elif image:
+        elif images:
             # Update session state
-            st.session_state.generated_image = image
+            st.session_state.generated_images = images
             st.session_state.error_message = None
             st.session_state.final_prompt = final_prompt
             
             # Show success message
             st.success("✅ Image generated successfully!")
-            
-            # Display image
-            st.markdown("### 🖼️ Generated Image")
-            st.image(image, width=500, caption="Generated at 768x768")
-            
-            # Display enhanced prompt
-            st.write("📝 Enhanced Prompt:", final_prompt)
-            
-            # Download button
-            st.markdown("### 📥 Download")
-            download_link = create_download_link(image, "generated_image.png")
-            st.markdown(download_link, unsafe_allow_html=True)
-    
-    # Show current image if available
-    elif st.session_state.generated_image and st.session_state.final_prompt:
-        st.markdown("### 🖼️ Current Generation")
-        st.image(st.session_state.generated_image, width=500, caption="Generated at 768x768")
-        
-        st.write("📝 Enhanced Prompt:", st.session_state.final_prompt)
-        
-        st.markdown("### 📥 Download")
-        download_link = create_download_link(st.session_state.generated_image, "generated_image.png")
-        st.markdown(download_link, unsafe_allow_html=True)
+    
+    # Show current images if available
+    if st.session_state.generated_images and st.session_state.final_prompt:
+        display_images(
+            st.session_state.generated_images,
+            st.session_state.final_prompt,
+            palette_download=settings.get("palette_download", False)
+        )
+
+
+def display_images(images: List[bytes], final_prompt: str, palette_download: bool = False):
+    """Display generated images with their enhanced prompt and download buttons."""
+    st.markdown("### 🖼️ Generated Image")
+    for image in images:
+        st.image(_preview_bytes(image), width=PREVIEW_SIZE, caption="Generated at 768x768")
+    
+    # Display enhanced prompt
+    st.write("📝 Enhanced Prompt:", final_prompt)
+    
+    # Download buttons
+    st.markdown("### 📥 Download")
+    for i, image in enumerate(images):
+        st.download_button(
+            f"📥 Download Image {i + 1}",
+            data=_palette_png_bytes(image) if palette_download else image,
+            file_name=f"generated_image_{i + 1}.png",
+            mime="image/png",
+            key=f"download_{i}"
+        )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _preview_bytes(png_bytes: bytes, size: int = PREVIEW_SIZE) -> bytes:
+    """Cache a LANCZOS downscale of PNG bytes for display; downloads keep full resolution."""
+    image = Image.open(BytesIO(png_bytes))
+    image.thumbnail((size, size), Image.Resampling.LANCZOS)
+    buffer = BytesIO()
+    image.save(buffer, format='PNG', compress_level=1)
+    return buffer.getvalue()
 
 
-def create_download_link(image: Image.Image, filename: str = "image.png") -> str:
-    """Create download link for an image."""
+@st.cache_data(max_entries=32, show_spinner=False)
+def _palette_png_bytes(png_bytes: bytes) -> bytes:
+    """Re-encode PNG bytes as an 8-bit palette PNG for smaller downloads."""
+    image = Image.open(BytesIO(png_bytes))
+    small = image.convert('P', palette=Image.Palette.ADAPTIVE, colors=256)
     buffer = BytesIO()
-    image.save(buffer, format='PNG')
-    buffer.seek(0)
-    b64 = base64.b64encode(buffer.getvalue()).decode()
-    href = f'<a href="data:file/png;base64,{b64}" download="{filename}"><button style="background-color: #FF4B4B; color: white; border: none; padding: 10px 20px; border-radius: 5px; cursor: pointer; font-weight: bold;">📥 Download Image</button></a>'
-    return href
+    small.save(buffer, format='PNG', optimize=False)
+    return buffer.getvalue()
 
 
 def render_footer():
@@ -392,23 +654,8 @@ def main():
 
 
 def apply_custom_css():
-    """Apply custom CSS for professional UI."""
-    st.markdown("""
-        <style>
-        .main { background-color: #0e1117; }
-        h1, h2, h3 { color: #ff4b4b; font-family: 'Helvetica Neue', sans-serif; }
-        .sidebar-content { background-color: #1e1e1e; }
-        .stButton > button { background-color: #ff4b4b; color: white; border: none; border-radius: 5px; padding: 10px 20px; font-weight: bold; }
-        .stButton > button:hover { background-color: #ff6b6b; }
-        .stButton > button:disabled { background-color: #555; color: #888; }
-        .stMetric { background-color: #1e1e1e; padding: 10px; border-radius: 5px; }
-        .stTextArea textarea { background-color: #1e1e1e; color: white; }
-        .stSelectbox > div > div { background-color: #1e1e1e; }
-        .stInfo, .stSuccess, .stError, .stWarning { background-color: #1e1e1e; }
-        code { background-color: #1e1e1e; }
-        hr { border-color: #333; }
-        </style>
-    """, unsafe_allow_html=True)
+    """Apply custom CSS for styles not covered by the theme in .streamlit/config.toml."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 
 # =============================================================================